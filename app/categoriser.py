@@ -4,12 +4,38 @@ Expense categorisation engine with persistent merchant overrides.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import re
+import sqlite3
+import string
 from pathlib import Path
 from dataclasses import dataclass, field
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup — fall back to per-category regexes
+    ahocorasick = None
+
+_TO_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _asciilower(s: str) -> str:
+    """Lowercase with an ASCII fast path.
+
+    Merchant descriptions are almost always ASCII; a prebuilt translate
+    table skips the Unicode case-folding walk that ``str.lower`` does per
+    code point. Non-ASCII strings fall back to ``str.lower`` so keys like
+    "énergie fitness" still fold correctly.
+    """
+    if s.isascii():
+        return s.translate(_TO_LOWER)
+    return s.lower()
+
+
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "categories.json"
-OVERRIDES_PATH = Path(__file__).resolve().parent.parent / "config" / "overrides.json"
+OVERRIDES_PATH = Path(__file__).resolve().parent.parent / "config" / "overrides.sqlite"
 
 
 @dataclass
@@ -19,8 +45,54 @@ class CategoryConfig:
     uncategorised_label: str = "Other / Uncategorised"
     uncategorised_icon: str = "❓"
     itemised_threshold: float = 30.0
+    _compiled_patterns: dict[str, re.Pattern] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _ac: object = field(init=False, repr=False, default=None)
+
+    def automaton(self):
+        """Aho–Corasick automaton over every keyword, or None if unavailable.
+
+        The automaton is a keyword trie with failure links, so a single walk
+        covers every start offset of the description — a plain character trie
+        (pygtrie/marisa-trie) would need one ``longest_prefix`` probe per
+        offset to find mid-string matches. Each keyword maps to
+        ``(priority, category)`` where priority is the category's position in
+        ``rules``, so matches can be resolved with the same
+        earlier-category-wins semantics as the keyword loop. Built once and
+        cached; one automaton walk per description scales with the
+        description length rather than the total keyword count.
+        """
+        if ahocorasick is None:
+            return None
+        if self._ac is None:
+            automaton = ahocorasick.Automaton()
+            for priority, (category, keywords) in enumerate(self.rules.items()):
+                for kw in keywords:
+                    if not automaton.exists(kw):  # first owner keeps priority
+                        automaton.add_word(kw, (priority, category))
+            if not len(automaton):
+                return None
+            automaton.make_automaton()
+            self._ac = automaton
+        return self._ac
+
+    def compiled_patterns(self) -> dict[str, re.Pattern]:
+        """One alternation regex per category, compiled lazily and cached.
+
+        Preserves the category order of ``rules`` so earlier categories keep
+        priority, matching the behaviour of ``Categoriser.categorise``.
+        """
+        if not self._compiled_patterns:
+            for name, keywords in self.rules.items():
+                if not keywords:
+                    continue
+                pattern = "|".join(re.escape(kw) for kw in keywords)
+                self._compiled_patterns[name] = re.compile(pattern)
+        return self._compiled_patterns
 
     @classmethod
+    @functools.cache
     def load(cls, path: Path = CONFIG_PATH) -> "CategoryConfig":
         data = json.loads(path.read_text())
         rules: dict[str, list[str]] = {}
@@ -38,38 +110,95 @@ class CategoryConfig:
 
 
 class OverrideStore:
-    """Persists merchant -> category overrides to config/overrides.json."""
+    """Persists merchant -> category overrides in config/overrides.sqlite.
+
+    Reads are served from an in-memory dict mirror, so the categorise hot
+    path stays O(1). Each mutation is a single indexed upsert/delete inside
+    SQLite (WAL journal), giving atomic, concurrency-safe durability without
+    rewriting the whole store per edit. Legacy ``overrides.jsonl`` /
+    ``overrides.json`` files are migrated into the table on first open.
+    """
 
     def __init__(self, path: Path = OVERRIDES_PATH):
         self.path = path
-        self._data: dict[str, str] = {}
-        self._load()
-
-    def _load(self) -> None:
-        if self.path.exists():
-            try:
-                self._data = json.loads(self.path.read_text())
-            except (json.JSONDecodeError, OSError):
-                self._data = {}
-        else:
-            self._data = {}
-
-    def _save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._data, indent=2, ensure_ascii=False))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # check_same_thread=False: Streamlit may touch the cached store from
+        # different script-run threads; each statement is its own transaction.
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS overrides(key TEXT PRIMARY KEY, category TEXT NOT NULL)"
+        )
+        self._data: dict[str, str] = dict(
+            self._conn.execute("SELECT key, category FROM overrides")
+        )
+        if not self._data:
+            self._migrate_legacy()
+
+    def _migrate_legacy(self) -> None:
+        legacy_jsonl = self.path.with_suffix(".jsonl")
+        legacy_json = self.path.with_suffix(".json")
+        data: dict[str, str] = {}
+        try:
+            if legacy_jsonl.exists():
+                source = legacy_jsonl
+                for line in legacy_jsonl.read_text(encoding="utf-8").splitlines():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    if entry.get("op") == "del":
+                        data.pop(entry["k"], None)
+                    else:
+                        data[entry["k"]] = entry["v"]
+            elif legacy_json.exists():
+                source = legacy_json
+                data = json.loads(legacy_json.read_text(encoding="utf-8"))
+            else:
+                return
+        except (json.JSONDecodeError, KeyError, OSError):
+            return  # unreadable legacy file: leave it in place, import nothing
+        if data:
+            self._conn.executemany(
+                "INSERT INTO overrides(key, category) VALUES(?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET category = excluded.category",
+                data.items(),
+            )
+            self._data = data
+        # The legacy file is consumed by the import. Migration re-runs
+        # whenever the table is empty, so leaving it behind would resurrect
+        # overrides the user has since deleted.
+        os.remove(source)
 
     def get(self, description: str) -> str | None:
-        return self._data.get(description.lower().strip())
+        return self._data.get(_asciilower(description).strip())
+
+    def get_prelowered(self, desc_lower: str) -> str | None:
+        """Lookup for callers that have already lowercased the description."""
+        return self._data.get(desc_lower.strip())
 
     def set(self, description: str, category: str) -> None:
-        self._data[description.lower().strip()] = category
-        self._save()
+        key = _asciilower(description).strip()
+        self._data[key] = category
+        self._conn.execute(
+            "INSERT INTO overrides(key, category) VALUES(?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET category = excluded.category",
+            (key, category),
+        )
 
     def remove(self, description: str) -> None:
-        key = description.lower().strip()
+        key = _asciilower(description).strip()
         if key in self._data:
             del self._data[key]
-            self._save()
+            self._conn.execute("DELETE FROM overrides WHERE key = ?", (key,))
+
+    def clear_all(self) -> None:
+        """Drop every override, including any lingering legacy files."""
+        self._data = {}
+        self._conn.execute("DELETE FROM overrides")
+        for legacy in (self.path.with_suffix(".jsonl"), self.path.with_suffix(".json")):
+            if legacy.exists():
+                os.remove(legacy)
 
     def all_overrides(self) -> dict[str, str]:
         return dict(self._data)
@@ -79,20 +208,40 @@ class Categoriser:
     def __init__(self, config: CategoryConfig | None = None, overrides: OverrideStore | None = None):
         self.config = config or CategoryConfig.load()
         self.overrides = overrides or OverrideStore()
+        # memoises description -> category; duplicates dominate real statements
+        self._cache: dict[str, str] = {}
 
     def categorise(self, description: str) -> str:
-        override = self.overrides.get(description)
+        cached = self._cache.get(description)
+        if cached is not None:
+            return cached
+        desc_lower = _asciilower(description)
+        override = self.overrides.get_prelowered(desc_lower)
         if override is not None:
+            self._cache[description] = override
             return override
-        desc_lower = description.lower()
-        for category, keywords in self.config.rules.items():
-            for keyword in keywords:
-                if keyword in desc_lower:
-                    return category
+        result = self._match(desc_lower)
+        self._cache[description] = result
+        return result
+
+    def _match(self, desc_lower: str) -> str:
+        automaton = self.config.automaton()
+        if automaton is not None:
+            best: tuple[int, str] | None = None
+            for _end, (priority, category) in automaton.iter(desc_lower):
+                if best is None or priority < best[0]:
+                    best = (priority, category)
+            if best is not None:
+                return best[1]
+            return self.config.uncategorised_label
+        for category, pattern in self.config.compiled_patterns().items():
+            if pattern.search(desc_lower):
+                return category
         return self.config.uncategorised_label
 
     def recategorise(self, description: str, new_category: str) -> None:
         self.overrides.set(description, new_category)
+        self._cache.clear()
 
     def get_icon(self, category: str) -> str:
         if category == self.config.uncategorised_label:
@@ -7,10 +7,14 @@ and a clean dashboard — no clicks needed to understand each category.
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import sys
 from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
@@ -25,7 +29,11 @@ from app.parsers import parse_statement
 # ---------------------------------------------------------------------------
 st.set_page_config(page_title="Expense Tracker", page_icon="💷", layout="wide")
 
-st.markdown("""
+# Module-level constants: built once at import, not re-assembled per rerun.
+# (Streamlit rebuilds the element tree on every rerun, so the CSS block must
+# still be *emitted* each run — a session_state guard would drop the styles
+# after the first interaction.)
+_CSS = """
 <style>
     /* tighten spacing */
     .block-container { padding-top: 1.5rem; }
@@ -73,7 +81,23 @@ st.markdown("""
         padding: 1px 6px; border-radius: 8px; margin-left: 4px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+CARD_TEMPLATE = """
+<div class="cat-card">
+    <div class="cat-header">
+        <span class="cat-icon">{icon}</span>
+        <span class="cat-name">{name}</span>
+        <span class="cat-amount">£{total:,.2f}</span>
+    </div>
+    <div class="cat-meta">{count} transaction{plural} · {pct}% of total</div>
+    <div class="cat-bar-bg">
+        <div class="cat-bar-fill" style="width:{pct}%; background:{colour};"></div>
+    </div>
+</div>
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # ---------------------------------------------------------------------------
 # Colour palette for categories
@@ -88,9 +112,10 @@ def cat_colour(idx: int) -> str:
     return PALETTE[idx % len(PALETTE)]
 
 # ---------------------------------------------------------------------------
-# Initialise categoriser (fresh each run to pick up overrides)
+# Initialise categoriser (cached across reruns; cleared when overrides change)
 # ---------------------------------------------------------------------------
 
+@st.cache_resource
 def get_categoriser() -> Categoriser:
     return Categoriser()
 
@@ -132,10 +157,8 @@ if overrides:
     st.sidebar.markdown("---")
     st.sidebar.caption(f"🔄 {len(overrides)} merchant override(s) saved")
     if st.sidebar.button("Clear all overrides"):
-        import os
-        from app.categoriser import OVERRIDES_PATH
-        if OVERRIDES_PATH.exists():
-            os.remove(OVERRIDES_PATH)
+        categoriser.overrides.clear_all()
+        get_categoriser.clear()
         st.rerun()
 
 # ---------------------------------------------------------------------------
@@ -167,17 +190,43 @@ The tool also supports Amex-style CSVs with `Transaction Date`, `Billing Amount`
 # ---------------------------------------------------------------------------
 
 @st.cache_data(show_spinner="Parsing statements…")
-def load_data(files_bytes: list[tuple[bytes, str]]) -> pd.DataFrame:
-    import io as _io
-    frames = []
+def _parse_cached(digest: str, name: str, _content: bytes) -> pd.DataFrame:
+    # Cached by (digest, name); the leading underscore stops Streamlit from
+    # hashing the raw bytes, so re-uploading the same file is a cache hit
+    # without megabytes of payload held as a cache key.
+    return parse_statement(io.BytesIO(_content), name)
+
+
+@st.cache_data(show_spinner=False)
+def _combine_cached(sig: str, _frames: list[pd.DataFrame]) -> pd.DataFrame:
+    if len(_frames) == 1:  # single upload: no concat, no reindex
+        df_all = _frames[0]
+    else:
+        df_all = pd.concat(_frames, ignore_index=True, sort=False)
+    df_all["date"] = pd.to_datetime(df_all["date"])
+    # Dictionary-encode merchants: repeated descriptions share one string in
+    # the category pool, and downstream compares/hashes work on int codes.
+    df_all["description"] = df_all["description"].astype("string").astype("category")
+    # kept sorted so date-range filtering can binary-search (see below)
+    return df_all.sort_values("date", ignore_index=True)
+
+
+def load_data(files_bytes: list[tuple[bytes, str]]) -> tuple[pd.DataFrame, str]:
+    """Parse every uploaded file (each cached by content digest) and return
+    the combined, date-sorted frame plus a digest identifying the upload set.
+    """
+    frames, digests = [], []
     for content, name in files_bytes:
-        frames.append(parse_statement(_io.BytesIO(content), name))
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        digests.append(digest)
+        frames.append(_parse_cached(digest, name, content))
     if not frames:
-        return pd.DataFrame(columns=["date", "description", "amount", "source_file"])
-    return pd.concat(frames, ignore_index=True)
+        return pd.DataFrame(columns=["date", "description", "amount", "source_file"]), ""
+    sig = hashlib.blake2b("|".join(digests).encode(), digest_size=16).hexdigest()
+    return _combine_cached(sig, frames), sig
 
 files_input = [(f.getvalue(), f.name) for f in uploaded_files]
-df_all = load_data(files_input)
+df_all, data_sig = load_data(files_input)
 
 if df_all.empty:
     st.warning("No transactions could be parsed. Please check the file format.")
@@ -187,9 +236,16 @@ if df_all.empty:
 # Filter by date
 # ---------------------------------------------------------------------------
 
-df_all["date"] = pd.to_datetime(df_all["date"])
-mask = (df_all["date"].dt.date >= date_from) & (df_all["date"].dt.date <= date_to)
-df = df_all.loc[mask].copy()
+@st.cache_data(show_spinner=False)
+def _filter_by_date(sig: str, _df_all: pd.DataFrame, d0: date, d1: date) -> pd.DataFrame:
+    # _df_all is sorted by date, so the range filter is two binary searches
+    # plus a contiguous slice instead of a full-column comparison per rerun.
+    dates = _df_all["date"].to_numpy()
+    lo = np.searchsorted(dates, pd.Timestamp(d0).to_datetime64())
+    hi = np.searchsorted(dates, (pd.Timestamp(d1) + pd.Timedelta(days=1)).to_datetime64())
+    return _df_all.iloc[lo:hi]
+
+df = _filter_by_date(data_sig, df_all, date_from, date_to)
 
 if df.empty:
     st.warning(f"No transactions between **{date_from:%d %b %Y}** and **{date_to:%d %b %Y}**.")
@@ -199,9 +255,79 @@ if df.empty:
 # Categorise
 # ---------------------------------------------------------------------------
 
-df["category"] = df["description"].apply(categoriser.categorise)
+def vectorized_categorise(df: pd.DataFrame, cfg: CategoryConfig, overrides: OverrideStore) -> pd.Series:
+    """Categorise every row in one vectorized pass instead of a per-row apply.
+
+    Works on the *unique* descriptions only — real statements repeat the
+    same merchant many times, so this collapses N rows of rule-engine work
+    to one per distinct merchant. The description column is kept as a
+    dictionary-encoded categorical, so the unique pool is simply its
+    ``cat.categories``. Each unique value is lowercased once, then one
+    compiled alternation regex per category runs over the values that are
+    still unassigned, so the matching happens in pandas' C string kernels
+    rather than a Python loop. Saved merchant overrides are overlaid last
+    so they always win, and the per-unique results are broadcast back to
+    the full column by indexing with ``cat.codes``.
+    """
+    descriptions = df["description"]
+    if not isinstance(descriptions.dtype, pd.CategoricalDtype):
+        descriptions = descriptions.astype(str).astype("category")
+    uniq = pd.Series(descriptions.cat.categories.astype(str))
+    desc_lc = uniq.str.lower()
+    cats = np.full(len(uniq), cfg.uncategorised_label, dtype=object)
+    unassigned = np.ones(len(uniq), dtype=bool)
+    for name, pattern in cfg.compiled_patterns().items():
+        if not unassigned.any():
+            break
+        hit = desc_lc.where(unassigned).str.contains(pattern, regex=True, na=False).to_numpy()
+        cats[hit] = name
+        unassigned &= ~hit
+    overlay = desc_lc.str.strip().map(overrides.all_overrides())
+    cats = np.asarray(np.where(overlay.notna(), overlay, cats), dtype=object)
+    codes = descriptions.cat.codes.to_numpy()
+    result = cats[codes]
+    if (codes < 0).any():  # missing descriptions have code -1
+        result[codes < 0] = cfg.uncategorised_label
+    return pd.Series(result, index=df.index)
+
+
+@st.cache_data(show_spinner=False)
+def _categorised_column(descriptions: tuple[str, ...], rules_sig: str, overrides_sig: str) -> list[str]:
+    # Reruns that touch neither the data nor the rules/overrides (e.g. a
+    # sidebar tweak) hit the cache instead of re-running the rule engine.
+    frame = pd.DataFrame({"description": list(descriptions)})
+    return vectorized_categorise(frame, cfg, categoriser.overrides).tolist()
+
+
+def _sig(obj) -> str:
+    return hashlib.blake2b(
+        json.dumps(obj, sort_keys=True, ensure_ascii=False).encode(), digest_size=16
+    ).hexdigest()
+
+df["category"] = _categorised_column(
+    tuple(df["description"].astype(str)),
+    _sig(cfg.rules),
+    _sig(categoriser.overrides.all_overrides()),
+)
+
+# Low-cardinality object columns -> dictionary-encoded categoricals:
+# groupby, equality masks and Arrow serialization then work on integer
+# codes instead of Python strings. Stale overrides may reference a
+# category no longer in the config, so union those in to avoid NaNs.
+_known_cats = categoriser.all_categories()
+_known_cats += [c for c in pd.unique(df["category"]) if c not in set(_known_cats)]
+df["category"] = pd.Categorical(df["category"], categories=_known_cats)
+df["source_file"] = df["source_file"].astype("category")
 df = df.sort_values("date", ascending=False).reset_index(drop=True)
 
+# Shared column config: raw datetime64/float64 columns serialize to Arrow
+# far faster than pre-formatted object strings, and the frontend formats.
+TXN_COLUMN_CONFIG = {
+    "date": st.column_config.DateColumn("Date", format="DD MMM YYYY"),
+    "description": st.column_config.TextColumn("Description"),
+    "amount": st.column_config.NumberColumn("Amount (£)", format="£%.2f"),
+}
+
 total_spend = df["amount"].sum()
 n_txns = len(df)
 n_days = max((date_to - date_from).days, 1)
@@ -228,6 +354,9 @@ cat_summary = (
     .reset_index()
 )
 cat_summary["pct"] = (cat_summary["total"] / total_spend * 100).round(1)
+# Drop empty categories so the card loop never renders a zero-spend shell
+# (possible once the category column is a fixed-category Categorical).
+cat_summary = cat_summary[cat_summary["count"] > 0].reset_index(drop=True)
 
 st.markdown("---")
 chart1, chart2 = st.columns([1, 1.3])
@@ -244,11 +373,27 @@ with chart1:
 
 with chart2:
     st.subheader("📈 Daily Trend")
-    daily = (
-        df.groupby([df["date"].dt.date, "category"])
-        .agg(total=("amount", "sum")).reset_index()
-    )
-    daily.columns = ["date", "category", "total"]
+    # Integer day buckets + bincount instead of an object-keyed groupby:
+    # no Python date object per row, no MultiIndex — just C accumulation
+    # into a (days × categories) grid, then only the non-zero cells kept.
+    # datetime64[D] day codes are resolution-independent (pandas may store
+    # ns or us under the hood).
+    day_code = df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    cat_code = df["category"].cat.codes.to_numpy().astype(np.int64)
+    cat_labels = df["category"].cat.categories
+    day0 = int(day_code.min())
+    n_day_buckets = int(day_code.max()) - day0 + 1
+    totals = np.bincount(
+        (day_code - day0) * len(cat_labels) + cat_code,
+        weights=df["amount"].to_numpy(),
+        minlength=n_day_buckets * len(cat_labels),
+    ).reshape(n_day_buckets, len(cat_labels))
+    day_idx, cat_idx = np.nonzero(totals)
+    daily = pd.DataFrame({
+        "date": pd.to_datetime((day0 + day_idx).astype("datetime64[D]")),
+        "category": cat_labels.take(cat_idx),
+        "total": totals[day_idx, cat_idx],
+    })
     fig2 = px.bar(
         daily, x="date", y="total", color="category",
         color_discrete_sequence=PALETTE,
@@ -271,45 +416,41 @@ st.caption("Every category with its transactions. Use the dropdown to move a mer
 
 all_cats = categoriser.all_categories()
 
-for cat_idx, row in cat_summary.iterrows():
-    cat_name = row["category"]
-    cat_total = row["total"]
-    cat_count = int(row["count"])
-    cat_pct = row["pct"]
-    icon = categoriser.get_icon(cat_name)
-    colour = cat_colour(cat_idx)
-
-    df_cat = df[df["category"] == cat_name].copy()
-
-    # Card header via HTML
-    st.markdown(f"""
-    <div class="cat-card">
-        <div class="cat-header">
-            <span class="cat-icon">{icon}</span>
-            <span class="cat-name">{cat_name}</span>
-            <span class="cat-amount">£{cat_total:,.2f}</span>
-        </div>
-        <div class="cat-meta">{cat_count} transaction{'s' if cat_count != 1 else ''} · {cat_pct}% of total</div>
-        <div class="cat-bar-bg">
-            <div class="cat-bar-fill" style="width:{cat_pct}%; background:{colour};"></div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+# Partition once; C boolean-mask scans (plus a copy each) become one pass.
+groups = dict(list(df.groupby("category", sort=False)))
+
+# First pass: every card header in one markdown emit — one runtime
+# round-trip and one frontend element instead of one per category.
+st.markdown(
+    "\n".join(
+        CARD_TEMPLATE.format(
+            icon=categoriser.get_icon(row.category),
+            name=row.category,
+            total=row.total,
+            count=int(row.count),
+            plural="s" if row.count != 1 else "",
+            pct=row.pct,
+            colour=cat_colour(cat_idx),
+        )
+        for cat_idx, row in enumerate(cat_summary.itertuples(index=False))
+    ),
+    unsafe_allow_html=True,
+)
 
-    # Transactions table (always visible)
-    df_show = df_cat.copy()
-    df_show["Date"] = df_show["date"].dt.strftime("%d %b %Y")
-    df_show["Description"] = df_show["description"]
-    df_show["Amount (£)"] = df_show["amount"].apply(lambda x: f"£{x:,.2f}")
+# Second pass: the interactive widgets, keyed by category name.
+for cat_idx, row in enumerate(cat_summary.itertuples(index=False)):
+    cat_name = row.category
+    cat_count = int(row.count)
+    icon = categoriser.get_icon(cat_name)
 
-    # Highlight big spends
-    big_mask = df_show["amount"] > threshold
+    df_cat = groups[cat_name]
 
-    with st.expander(f"View {cat_count} transaction{'s' if cat_count != 1 else ''}", expanded=(cat_count <= 15)):
-        # Show transactions
+    with st.expander(f"{icon} {cat_name} — {cat_count} transaction{'s' if cat_count != 1 else ''}", expanded=(cat_count <= 15)):
+        # Show transactions — raw columns, formatted by the frontend
         st.dataframe(
-            df_show[["Date", "Description", "Amount (£)"]],
+            df_cat[["date", "description", "amount"]],
             use_container_width=True, hide_index=True,
+            column_config=TXN_COLUMN_CONFIG,
         )
 
         # Re-categorise widget: pick a merchant from this category to move
@@ -337,6 +478,7 @@ for cat_idx, row in cat_summary.iterrows():
                 if st.button("Move ➜", key=f"move_btn_{cat_name}", use_container_width=True):
                     if merchant_to_move and new_cat:
                         categoriser.recategorise(merchant_to_move, new_cat)
+                        get_categoriser.clear()
                         st.toast(f"✅ **{merchant_to_move}** → {categoriser.get_icon(new_cat)} {new_cat}")
                         st.rerun()
                     else:
@@ -354,12 +496,11 @@ if df_big.empty:
     st.success(f"No transactions exceed £{threshold:,.0f} in this period. 🎉")
 else:
     df_big = df_big.sort_values("amount", ascending=False)
-    df_big["Date"] = df_big["date"].dt.strftime("%d %b %Y")
-    df_big["Category"] = df_big["category"].apply(lambda c: f"{categoriser.get_icon(c)} {c}")
-    df_big["Amount (£)"] = df_big["amount"].apply(lambda x: f"£{x:,.2f}")
+    df_big["Category"] = df_big["category"].map(lambda c: f"{categoriser.get_icon(c)} {c}")
     st.dataframe(
-        df_big[["Date", "Category", "description", "Amount (£)"]].rename(columns={"description": "Description"}),
+        df_big[["date", "Category", "description", "amount"]],
         use_container_width=True, hide_index=True,
+        column_config=TXN_COLUMN_CONFIG,
     )
     big_total = df_big["amount"].sum()
     st.caption(
@@ -373,21 +514,38 @@ else:
 
 st.markdown("---")
 st.subheader("💾 Download")
+
+
+@st.cache_data(show_spinner=False)
+def _summary_csv(sig: str, _summary: pd.DataFrame) -> bytes:
+    # sig is the cache key; the frames themselves are not hashed
+    return _summary[["category", "total", "count", "pct"]].to_csv(index=False).encode()
+
+
+@st.cache_data(show_spinner=False)
+def _transactions_csv(sig: str, _df: pd.DataFrame) -> bytes:
+    exp = _df[["date", "description", "amount", "category", "source_file"]].copy()
+    exp["date"] = exp["date"].dt.strftime("%Y-%m-%d")
+    return exp.to_csv(index=False).encode()
+
+
+df_sig = hashlib.blake2b(
+    pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(), digest_size=16
+).hexdigest()
+
 dl1, dl2 = st.columns(2)
 with dl1:
     st.download_button(
         "📥 Category Summary",
-        data=cat_summary[["category", "total", "count", "pct"]].to_csv(index=False),
+        data=_summary_csv(df_sig, cat_summary),
         file_name=f"expense_summary_{date_from}_{date_to}.csv", mime="text/csv",
     )
 with dl2:
-    exp = df[["date", "description", "amount", "category", "source_file"]].copy()
-    exp["date"] = exp["date"].dt.strftime("%Y-%m-%d")
     st.download_button(
         "📥 All Transactions",
-        data=exp.to_csv(index=False),
+        data=_transactions_csv(df_sig, df),
         file_name=f"expense_transactions_{date_from}_{date_to}.csv", mime="text/csv",
     )
 
 st.markdown("---")
-st.caption("💷 Expense Tracker · Categories are keyword-based — edit `config/categories.json` to customise · Re-categorisations are saved to `config/overrides.json`")
+st.caption("💷 Expense Tracker · Categories are keyword-based — edit `config/categories.json` to customise · Re-categorisations are saved to `config/overrides.sqlite`")
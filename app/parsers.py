@@ -23,34 +23,122 @@ Credits / refunds are filtered out.
 from __future__ import annotations
 
 import io
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import BinaryIO
 
+import numpy as np
 import pandas as pd
 
+try:
+    import charset_normalizer
+except ImportError:  # optional — encoding detection falls back to probing
+    charset_normalizer = None
+
 
 # ---------------------------------------------------------------------------
 # helpers
 # ---------------------------------------------------------------------------
 
+# Probe table for _to_date: first regex that matches every sampled value
+# selects the candidate strptime formats, tried in order. Day-first
+# variants come before month-first (UK banks), mirroring the old cascade.
+_DATE_PROBES = [
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), ("%d/%m/%Y", "%m/%d/%Y")),
+    (re.compile(r"^\d{1,2}-\d{1,2}-\d{4}$"), ("%d-%m-%Y", "%m-%d-%Y")),
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), ("%Y-%m-%d",)),
+    (re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"), ("%Y-%m-%d %H:%M:%S",)),
+    (re.compile(r"^\d{1,2} [A-Za-z]{3} \d{4}$"), ("%d %b %Y",)),
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{2}$"), ("%d/%m/%y", "%m/%d/%y")),
+]
+
+
+# Streamed parsing pins the date format chosen for a file's first block so
+# later blocks cannot resolve an ambiguous day/month column differently.
+# Thread-local because parse_multiple parses files on a pool.
+_date_pin = threading.local()
+
+
 def _to_date(series: pd.Series) -> pd.Series:
-    """Try a few common UK date formats."""
-    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d %b %Y", "%d/%m/%y", "%m/%d/%Y"):
-        try:
-            return pd.to_datetime(series, format=fmt, dayfirst=True)
-        except (ValueError, TypeError):
-            continue
-    # fallback: let pandas infer
-    return pd.to_datetime(series, dayfirst=True, format="mixed")
+    """Parse dates with one explicitly formatted pass.
+
+    Rather than calling ``pd.to_datetime`` once per candidate format and
+    discarding the work whenever a later row raises, probe a sample of the
+    values against format regexes and parse the unique strings exactly once
+    with the winning format (statements repeat the same date many times, so
+    the results are broadcast back with a dict map). A candidate format only
+    wins if it parses *every* unique value — a US-format column matches the
+    same slash probe as a UK one, so committing to ``%d/%m/%Y`` on the first
+    NaT would silently drop day>12 rows. Falls back to a single mixed-format
+    inference pass if no probe or candidate fits. While ``_date_pin`` holds
+    a format pinned by ``_parse_streamed``, that format is used directly.
+    """
+    pinned = getattr(_date_pin, "fmt", None)
+    if pinned == "mixed":
+        return pd.to_datetime(series, dayfirst=True, format="mixed", errors="coerce")
+    if pinned is not None:
+        unique_vals = series.dropna().unique()
+        parsed = pd.to_datetime(unique_vals, format=pinned, errors="coerce")
+        return series.map(dict(zip(unique_vals, parsed)))
+    sample = series.dropna().astype(str).str.strip().head(50)
+    if not sample.empty:
+        for probe, fmts in _DATE_PROBES:
+            if sample.str.match(probe).all():
+                unique_vals = series.dropna().unique()
+                for fmt in fmts:
+                    parsed = pd.to_datetime(unique_vals, format=fmt, errors="coerce")
+                    if not parsed.isna().any():
+                        if getattr(_date_pin, "recording", False):
+                            _date_pin.fmt = fmt
+                        return series.map(dict(zip(unique_vals, parsed)))
+                break
+    if getattr(_date_pin, "recording", False):
+        _date_pin.fmt = "mixed"
+    return pd.to_datetime(series, dayfirst=True, format="mixed", errors="coerce")
+
+
+# Strips thousands separators, currency symbols, spaces and the NBSP that
+# some UK bank exports emit, and turns accounting-style parentheses into a
+# leading minus ("(12.50)" -> "-12.50"), all in one pass.
+_MONEY_TRANS = str.maketrans(
+    {",": None, "£": None, "$": None, " ": None, "\xa0": None, "(": "-", ")": None}
+)
+
+
+def _to_money(series: pd.Series) -> pd.Series:
+    """Coerce an amount column to float, cleaning currency formatting.
+
+    A single prebuilt ``str.translate`` per cell replaces the chained
+    ``.str.replace(",", "").str.replace("£", "")`` passes, which each
+    materialised a full intermediate Series (and compiled a pattern per
+    call). Columns that are already numeric skip the cleaning entirely.
+    """
+    if series.dtype.kind in "fi":
+        return series
+    cleaned = series.map(lambda x: x.translate(_MONEY_TRANS) if isinstance(x, str) else x)
+    return pd.to_numeric(cleaned, errors="coerce")
 
 
 def _normalise(df: pd.DataFrame, source: str) -> pd.DataFrame:
     """Return only the four expected columns, dropping NaNs."""
     df = df[["date", "description", "amount"]].copy()
-    df["source_file"] = source
+    # the filename repeats on every row — dictionary-encode it up front
+    # rather than storing one Python string reference per row
+    df["source_file"] = pd.Categorical.from_codes(
+        np.zeros(len(df), dtype=np.int8), categories=[source]
+    )
     df.dropna(subset=["date", "amount"], inplace=True)
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").abs()
+    # callers normally hand over a float column already — only re-coerce
+    # (and only take abs) when actually needed
+    amount = df["amount"]
+    if amount.dtype.kind not in "fi":
+        amount = pd.to_numeric(amount, errors="coerce")
+    if (amount < 0).any():
+        amount = amount.abs()
+    df["amount"] = amount
     df = df[df["amount"] > 0]
     df.reset_index(drop=True, inplace=True)
     return df
@@ -60,203 +148,219 @@ def _normalise(df: pd.DataFrame, source: str) -> pd.DataFrame:
 # Format-specific parsers
 # ---------------------------------------------------------------------------
 
-def _parse_monzo(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "transaction id" not in cols:
+def _parse_monzo(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    if "transaction id" not in col_set:
         return None
-    df_raw.columns = cols
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw["date"])
-    df["description"] = df_raw.get("name", df_raw.get("description", ""))
-    # Monzo amounts are negative for debits
-    raw_amount = pd.to_numeric(df_raw["amount"], errors="coerce")
-    df["amount"] = raw_amount
-    # keep only debits (negative amounts in Monzo)
-    df = df[df["amount"] < 0].copy()
-    df["amount"] = df["amount"].abs()
+    # Monzo amounts are negative for debits: negate, then keep the positive
+    # rows — one filtered frame instead of a copy plus an abs() pass
+    df = pd.DataFrame({
+        "date": _to_date(df_raw["date"]),
+        "description": df_raw.get("name", df_raw.get("description", "")),
+        "amount": -pd.to_numeric(df_raw["amount"], errors="coerce"),
+    })
+    df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_starling(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "counter party" not in cols and "counterparty" not in cols:
+def _parse_starling(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    if "counter party" not in col_set and "counterparty" not in col_set:
         return None
-    df_raw.columns = cols
-    cp_col = "counter party" if "counter party" in cols else "counterparty"
-    amt_col = [c for c in cols if "amount" in c and "gbp" in c]
+    cp_col = "counter party" if "counter party" in col_set else "counterparty"
+    amt_col = [c for c in df_raw.columns if "amount" in c and "gbp" in c]
     if not amt_col:
-        amt_col = [c for c in cols if "amount" in c]
+        amt_col = [c for c in df_raw.columns if "amount" in c]
     amt_col = amt_col[0] if amt_col else "amount"
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw["date"])
     ref = df_raw.get("reference", pd.Series([""] * len(df_raw)))
-    df["description"] = df_raw[cp_col].astype(str) + " " + ref.astype(str)
-    raw_amount = pd.to_numeric(df_raw[amt_col].astype(str).str.replace(",", ""), errors="coerce")
-    df["amount"] = raw_amount
-    df = df[df["amount"] < 0].copy()
-    df["amount"] = df["amount"].abs()
+    df = pd.DataFrame({
+        "date": _to_date(df_raw["date"]),
+        # list-comp with f-strings beats element-wise pandas `+` on object
+        # dtype, and skips two intermediate astype(str) allocations
+        "description": [
+            f"{cp} {r}" for cp, r in zip(df_raw[cp_col].to_numpy(), ref.to_numpy())
+        ],
+        "amount": -_to_money(df_raw[amt_col]),
+    })
+    df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_revolut(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "completed date" not in cols and "started date" not in cols:
+def _parse_revolut(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    if "completed date" not in col_set and "started date" not in col_set:
         return None
-    df_raw.columns = cols
-    date_col = "completed date" if "completed date" in cols else "started date"
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw[date_col])
-    df["description"] = df_raw["description"]
-    raw_amount = pd.to_numeric(df_raw["amount"].astype(str).str.replace(",", ""), errors="coerce")
-    df["amount"] = raw_amount
-    df = df[df["amount"] < 0].copy()
-    df["amount"] = df["amount"].abs()
+    date_col = "completed date" if "completed date" in col_set else "started date"
+    df = pd.DataFrame({
+        "date": _to_date(df_raw[date_col]),
+        "description": df_raw["description"],
+        "amount": -_to_money(df_raw["amount"]),
+    })
+    df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_lloyds(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "transaction description" not in cols or "debit amount" not in cols:
+def _parse_lloyds(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    if "transaction description" not in col_set or "debit amount" not in col_set:
         return None
-    df_raw.columns = cols
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw["transaction date"])
-    df["description"] = df_raw["transaction description"]
-    df["amount"] = pd.to_numeric(
-        df_raw["debit amount"].astype(str).str.replace(",", ""), errors="coerce"
-    )
+    df = pd.DataFrame({
+        "date": _to_date(df_raw["transaction date"]),
+        "description": df_raw["transaction description"],
+        "amount": _to_money(df_raw["debit amount"]),
+    })
     df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_hsbc(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "debit" not in cols or "credit" not in cols:
+def _parse_hsbc(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    if "debit" not in col_set or "credit" not in col_set:
         return None
-    df_raw.columns = cols
-    desc_col = "description" if "description" in cols else cols[1]
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw["date"])
-    df["description"] = df_raw[desc_col]
-    df["amount"] = pd.to_numeric(
-        df_raw["debit"].astype(str).str.replace(",", ""), errors="coerce"
-    )
+    desc_col = "description" if "description" in col_set else df_raw.columns[1]
+    df = pd.DataFrame({
+        "date": _to_date(df_raw["date"]),
+        "description": df_raw[desc_col],
+        "amount": _to_money(df_raw["debit"]),
+    })
     df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_amex_detailed(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
+def _parse_amex_detailed(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
     """Amex UK CSV with Transaction Date, Billing Amount, Merchant, Debit or Credit."""
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "billing amount" not in cols or "merchant" not in cols or "debit or credit" not in cols:
+    if "billing amount" not in col_set or "merchant" not in col_set or "debit or credit" not in col_set:
         return None
-    df_raw.columns = cols
     # Find the date column
-    date_col = "transaction date" if "transaction date" in cols else "posting date"
-    # Keep only debits (DBIT)
-    df_debits = df_raw[df_raw["debit or credit"].str.upper() == "DBIT"].copy()
+    date_col = "transaction date" if "transaction date" in col_set else "posting date"
+    # Keep only debits ("DBIT" / "Debit"): checking the first character is
+    # enough to split the two-value column without uppercasing every cell
+    df_debits = df_raw[df_raw["debit or credit"].str.startswith(("D", "d"), na=False)]
     if df_debits.empty:
         return None
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_debits[date_col])
-    df["description"] = df_debits["merchant"].astype(str).str.strip()
-    df["amount"] = pd.to_numeric(
-        df_debits["billing amount"].astype(str).str.replace(",", ""), errors="coerce"
-    )
+    df = pd.DataFrame({
+        "date": _to_date(df_debits[date_col]),
+        "description": df_debits["merchant"].astype(str).str.strip(),
+        "amount": _to_money(df_debits["billing amount"]),
+    })
     df = df[df["amount"] > 0]
     return _normalise(df, source)
 
 
-def _parse_amex(df_raw: pd.DataFrame, source: str) -> pd.DataFrame | None:
-    cols = [c.lower().strip() for c in df_raw.columns]
-    if "amount" in cols and "description" in cols and len(cols) <= 6:
-        df_raw.columns = cols
-        df = pd.DataFrame()
-        df["date"] = _to_date(df_raw["date"])
-        df["description"] = df_raw["description"]
-        df["amount"] = pd.to_numeric(
-            df_raw["amount"].astype(str).str.replace(",", ""), errors="coerce"
-        )
-        # Amex: positive = charge, negative = credit/refund
-        df = df[df["amount"] > 0]
-        return _normalise(df, source)
-    return None
+def _parse_amex(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame | None:
+    # column checks (including the <= 6 width cap) live in DISPATCH
+    df = pd.DataFrame({
+        "date": _to_date(df_raw["date"]),
+        "description": df_raw["description"],
+        "amount": _to_money(df_raw["amount"]),
+    })
+    # Amex: positive = charge, negative = credit/refund
+    df = df[df["amount"] > 0]
+    return _normalise(df, source)
 
 
 # ---------------------------------------------------------------------------
 # Generic / fallback parser
 # ---------------------------------------------------------------------------
 
-def _parse_generic(df_raw: pd.DataFrame, source: str) -> pd.DataFrame:
+# Column matchers for _parse_generic: exact candidates in preference order,
+# then a substring regex compiled once at import for the fuzzy fallback.
+_DATE_CANDIDATES = ("date", "transaction date", "trans date", "posted date", "value date")
+_DATE_RE = re.compile(r"date")
+_DESC_CANDIDATES = ("description", "transaction description", "narrative",
+                    "details", "memo", "name", "payee", "merchant")
+_DESC_RE = re.compile(r"desc|narr|detail|memo")
+_AMT_CANDIDATES = ("amount", "debit", "debit amount", "value", "transaction amount")
+_AMT_RE = re.compile(r"amount|debit|value")
+
+
+def _parse_generic(df_raw: pd.DataFrame, col_set: frozenset[str], source: str) -> pd.DataFrame:
     """Best-effort parser: look for date-like, description-like and amount-like columns."""
-    cols = [c.lower().strip() for c in df_raw.columns]
-    df_raw.columns = cols
-
-    # Find date column
-    date_col = None
-    for candidate in ("date", "transaction date", "trans date", "posted date", "value date"):
-        if candidate in cols:
-            date_col = candidate
-            break
-    if date_col is None:
-        for c in cols:
-            if "date" in c:
-                date_col = c
-                break
+    cols = list(df_raw.columns)
+
+    date_col = next((c for c in _DATE_CANDIDATES if c in col_set), None)
     if date_col is None:
-        date_col = cols[0]
-
-    # Find description column
-    desc_col = None
-    for candidate in ("description", "transaction description", "narrative",
-                       "details", "memo", "name", "payee", "merchant"):
-        if candidate in cols:
-            desc_col = candidate
-            break
-    if desc_col is None:
-        for c in cols:
-            if "desc" in c or "narr" in c or "detail" in c or "memo" in c:
-                desc_col = c
-                break
+        date_col = next((c for c in cols if _DATE_RE.search(c)), cols[0])
+
+    desc_col = next((c for c in _DESC_CANDIDATES if c in col_set), None)
     if desc_col is None:
-        desc_col = cols[1] if len(cols) > 1 else cols[0]
-
-    # Find amount column
-    amt_col = None
-    for candidate in ("amount", "debit", "debit amount", "value", "transaction amount"):
-        if candidate in cols:
-            amt_col = candidate
-            break
-    if amt_col is None:
-        for c in cols:
-            if "amount" in c or "debit" in c or "value" in c:
-                amt_col = c
-                break
+        desc_col = next(
+            (c for c in cols if _DESC_RE.search(c)),
+            cols[1] if len(cols) > 1 else cols[0],
+        )
+
+    amt_col = next((c for c in _AMT_CANDIDATES if c in col_set), None)
     if amt_col is None:
-        amt_col = cols[-1]
+        amt_col = next((c for c in cols if _AMT_RE.search(c)), cols[-1])
 
-    df = pd.DataFrame()
-    df["date"] = _to_date(df_raw[date_col])
-    df["description"] = df_raw[desc_col].astype(str)
-    raw_amount = pd.to_numeric(
-        df_raw[amt_col].astype(str).str.replace(",", "").str.replace("£", ""), errors="coerce"
-    )
-    df["amount"] = raw_amount.abs()
+    df = pd.DataFrame({
+        "date": _to_date(df_raw[date_col]),
+        "description": df_raw[desc_col].astype(str),
+        "amount": _to_money(df_raw[amt_col]).abs(),
+    })
     return _normalise(df, source)
 
 
+# First line containing at least two commas, i.e. the header of the table
+_CSV_LINE_RE = re.compile(rb"^[^\n]*,[^\n]*,[^\n]*$", re.MULTILINE)
+
+# Files above this size are parsed in streamed row blocks instead of one shot
+_STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+_STREAM_CHUNK_ROWS = 100_000
+
+
+def _detect_encoding(content: bytes) -> str:
+    """Pick a decodable encoding by probing a 64KB prefix (utf-8-sig first,
+    which also strips a BOM). A multi-byte character split at the prefix
+    boundary still counts as UTF-8. Non-UTF-8 files go through
+    charset-normalizer's statistical detection when it is installed, which
+    distinguishes cp1252 from latin-1 and friends instead of guessing;
+    the blind cp1252/latin-1 probe remains as the fallback."""
+    prefix = content[:65536]
+    try:
+        prefix.decode("utf-8-sig")
+        return "utf-8-sig"
+    except UnicodeDecodeError as exc:
+        if exc.start >= len(prefix) - 4 and len(content) > len(prefix):
+            return "utf-8-sig"
+    if charset_normalizer is not None:
+        # restrict to the candidates we would otherwise probe blindly —
+        # unconstrained detection can land on e.g. cp1250 for short files
+        best = charset_normalizer.from_bytes(
+            prefix, cp_isolation=["cp1252", "latin_1"]
+        ).best()
+        if best is not None:
+            return best.encoding
+    for enc in ("cp1252", "latin-1"):
+        try:
+            prefix.decode(enc)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-PARSERS = [
-    _parse_amex_detailed,
-    _parse_monzo,
-    _parse_starling,
-    _parse_revolut,
-    _parse_lloyds,
-    _parse_hsbc,
-    _parse_amex,
+def _has(*cols: str):
+    """Predicate factory: true when every named column is present."""
+    required = frozenset(cols)
+    return lambda col_set: required <= col_set
+
+
+# Ordered (predicate, parser) pairs: a parser only runs when its predicate
+# accepts the column set, so a Starling CSV no longer pays for failed
+# Amex/Monzo attempts (each of which ran _to_date/to_numeric before giving
+# up). Order preserves the old try-each priority. Predicates also carry any
+# extra heuristics — the Amex entry caps the column count so wide generic
+# exports still reach _parse_generic.
+DISPATCH = [
+    (_has("billing amount", "merchant", "debit or credit"), _parse_amex_detailed),
+    (_has("transaction id", "amount"), _parse_monzo),
+    (_has("counter party"), _parse_starling),
+    (_has("counterparty"), _parse_starling),
+    (_has("completed date"), _parse_revolut),
+    (_has("started date"), _parse_revolut),
+    (_has("transaction description", "debit amount"), _parse_lloyds),
+    (_has("debit", "credit"), _parse_hsbc),
+    (lambda cs: {"date", "description", "amount"} <= cs and len(cs) <= 6, _parse_amex),
 ]
 
 
@@ -272,44 +376,107 @@ def parse_statement(file: BinaryIO, filename: str) -> pd.DataFrame:
         df_raw = pd.read_excel(file)
     else:
         content = file.read()
-        # Try common encodings
-        for enc in ("utf-8", "latin-1", "cp1252"):
-            try:
-                text = content.decode(enc)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            text = content.decode("utf-8", errors="replace")
-
-        # Skip leading blank / header lines that some banks add
-        lines = text.strip().splitlines()
-        start = 0
-        for i, line in enumerate(lines):
-            if "," in line and len(line.split(",")) >= 3:
-                start = i
-                break
-        cleaned = "\n".join(lines[start:])
-        df_raw = pd.read_csv(io.StringIO(cleaned), on_bad_lines="skip")
+        enc = _detect_encoding(content)
+
+        # Skip leading blank / preamble lines that some banks add: one
+        # C-level regex scan over the raw bytes finds the first line with at
+        # least two commas — no splitlines() allocation per line.
+        m = _CSV_LINE_RE.search(content)
+        start_byte = m.start() if m else 0
+        data = content[start_byte:] if start_byte else content
+        if len(data) > _STREAM_THRESHOLD_BYTES:
+            # Very large exports are streamed in row blocks so the raw frame
+            # never has to exist in full. The pyarrow engine does not support
+            # chunksize, so streaming always goes through the C parser.
+            reader = pd.read_csv(
+                io.BytesIO(data), encoding=enc, on_bad_lines="skip",
+                engine="c", chunksize=_STREAM_CHUNK_ROWS,
+            )
+            return _parse_streamed(reader, filename)
+        # Decoding happens inside the parser — no full-file Python str
+        # round-trip, no StringIO copy. Arrow's reader parses in parallel
+        # threads; fall back to the C engine if pyarrow is unavailable or
+        # rejects the file.
+        try:
+            df_raw = pd.read_csv(
+                io.BytesIO(data), encoding=enc, on_bad_lines="skip",
+                engine="pyarrow", dtype_backend="pyarrow",
+            )
+        except (ImportError, ValueError, pd.errors.ParserError):
+            df_raw = pd.read_csv(
+                io.BytesIO(data), encoding=enc, on_bad_lines="skip", engine="c",
+            )
+
+    return _dispatch(df_raw, filename)
+
 
+def _dispatch(df_raw: pd.DataFrame, filename: str) -> pd.DataFrame:
+    """Route a raw frame to the first matching specialised parser."""
     if df_raw.empty:
         return pd.DataFrame(columns=["date", "description", "amount", "source_file"])
 
-    # Try specialised parsers in order
-    for parser_fn in PARSERS:
-        result = parser_fn(df_raw, filename)
-        if result is not None and not result.empty:
-            return result
+    # Normalise headers once; parsers receive the set for O(1) membership
+    df_raw.columns = [str(c).lower().strip() for c in df_raw.columns]
+    col_set = frozenset(df_raw.columns)
+
+    # Dispatch to the first specialised parser whose predicate accepts the
+    # column set
+    for matches, parser_fn in DISPATCH:
+        if matches(col_set):
+            result = parser_fn(df_raw, col_set, filename)
+            if result is not None and not result.empty:
+                return result
 
     # Fallback
-    return _parse_generic(df_raw, filename)
+    return _parse_generic(df_raw, col_set, filename)
 
 
-def parse_multiple(files: list[tuple[BinaryIO, str]]) -> pd.DataFrame:
-    """Parse several statement files and concatenate into one DataFrame."""
+def _parse_streamed(reader, filename: str) -> pd.DataFrame:
+    """Parse a chunked CSV reader with one parser and one date format.
+
+    The parser is selected from the first block's columns and reused for
+    every later block. Re-dispatching per block would let a block made up
+    entirely of credits fall through to _parse_generic — whose abs() counts
+    refunds as spending — and per-block date probing could resolve an
+    ambiguous day/month column differently between blocks, so the format
+    chosen while parsing the first block is pinned for the rest of the file.
+    """
+    parser_fn = None
+    col_set = None
     frames = []
-    for fobj, fname in files:
-        frames.append(parse_statement(fobj, fname))
+    _date_pin.recording = True
+    try:
+        for chunk in reader:
+            chunk.columns = [str(c).lower().strip() for c in chunk.columns]
+            if parser_fn is None:
+                col_set = frozenset(chunk.columns)
+                parser_fn = next(
+                    (fn for matches, fn in DISPATCH if matches(col_set)),
+                    _parse_generic,
+                )
+            result = parser_fn(chunk, col_set, filename)
+            _date_pin.recording = False
+            if result is not None and not result.empty:
+                frames.append(result)
+    finally:
+        _date_pin.recording = False
+        _date_pin.fmt = None
     if not frames:
         return pd.DataFrame(columns=["date", "description", "amount", "source_file"])
-    return pd.concat(frames, ignore_index=True)
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def parse_multiple(files: list[tuple[BinaryIO, str]]) -> pd.DataFrame:
+    """Parse several statement files and concatenate into one DataFrame.
+
+    Files are parsed on a thread pool — read_csv's C parser releases the
+    GIL, so several statements decode in parallel.
+    """
+    if not files:
+        return pd.DataFrame(columns=["date", "description", "amount", "source_file"])
+    if len(files) == 1:
+        return parse_statement(*files[0])
+    workers = min(len(files), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(lambda pair: parse_statement(*pair), files))
+    return pd.concat(frames, ignore_index=True, sort=False)